@@ -1,9 +1,37 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
+import pytest
+
+
+def mpi_size():
+    try:
+        import mpi4py.MPI as MPI
+    except ImportError:
+        return 1
+    return MPI.COMM_WORLD.size
+
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "example: example scripts")
     config.addinivalue_line("markers", "fenics: FEniCS tests")
     config.addinivalue_line("markers", "firedrake: Firedrake tests")
     config.addinivalue_line("markers", "numpy: NumPy tests")
+
+    # pytest-xdist workers are not MPI processes
+    if config.getoption("numprocesses", None) and mpi_size() > 1:
+        raise pytest.UsageError("pytest-xdist cannot be used with MPI")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def xdist_worker_directory(tmp_path_factory):
+    # Run each pytest-xdist worker in a separate directory, so that files
+    # written to relative paths (e.g. checkpoint files) are not shared
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        cwd = os.getcwd()
+        os.chdir(tmp_path_factory.getbasetemp())
+        yield
+        os.chdir(cwd)
+    else:
+        yield
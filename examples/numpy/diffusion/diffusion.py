@@ -179,7 +179,7 @@ def forward(psi_0, kappa):
 
         def _assemble_A(self, kappa):
             if self._A_kappa is None \
-               or abs(self._A_kappa - kappa.vector()).max() > 0.0:
+               or not np.array_equal(self._A_kappa, kappa.vector()):
                 self._A = A(kappa, alpha=self._alpha, beta=self._beta)
                 self._A_kappa = kappa.vector().copy()
 
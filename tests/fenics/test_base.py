@@ -23,8 +23,8 @@ from tlm_adjoint.fenics import *
 from tlm_adjoint.fenics import manager as _manager
 from tlm_adjoint.fenics.backend import backend_Constant, backend_Function
 
-import copy
 import gc
+import itertools
 import logging
 import mpi4py.MPI as MPI
 import numpy as np
@@ -75,17 +75,8 @@ def setup_test():
 
 
 def params_set(names, *values):
-    if len(values) > 1:
-        sub_params = params_set(names[1:], *values[1:])
-        params = []
-        for value in values[0]:
-            for sub_params_ in sub_params:
-                new_params = copy.deepcopy(sub_params_)
-                new_params[names[0]] = value
-                params.append(new_params)
-    else:
-        params = [{names[0]:value} for value in values[0]]
-    return params
+    return [dict(zip(names, params))
+            for params in itertools.product(*values)]
 
 
 @pytest.fixture(params=params_set(["enable_caching", "defer_adjoint_assembly"],
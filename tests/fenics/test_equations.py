@@ -372,10 +372,9 @@ def test_PointInterpolationSolver(setup_test, test_leaks, test_ghost_modes,
         P[0] = eq._P
 
         J = Functional(name="J")
-        for x in X_vals:
-            term = new_real_function()
-            ExprEvaluationSolver(x ** 3, term).solve()
-            J.addto(term)
+        J_term = new_real_function()
+        ExprEvaluationSolver(sum(x ** 3 for x in X_vals), J_term).solve()
+        J.addto(J_term)
         return X_vals, J
 
     z = Function(z_space, name="z", static=True)
@@ -385,13 +384,10 @@ def test_PointInterpolationSolver(setup_test, test_leaks, test_ghost_modes,
     X_vals, J = forward(z)
     stop_manager()
 
-    def x_ref(x):
-        return x[0] ** 3 - 1.5 * x[0] * x[1] + 1.5
-
-    x_error_norm = 0.0
-    for x, x_coord in zip(X_vals, X_coords):
-        x_error_norm = max(x_error_norm,
-                           abs(real_function_value(x) - x_ref(x_coord)))
+    x_vals = np.fromiter(map(real_function_value, X_vals),
+                         dtype=np.float64, count=len(X_vals))
+    x_ref = X_coords[:, 0] ** 3 - 1.5 * X_coords[:, 0] * X_coords[:, 1] + 1.5
+    x_error_norm = abs(x_vals - x_ref).max()
     info(f"Error norm = {x_error_norm:.16e}")
     assert x_error_norm < 1.0e-13
 
@@ -625,15 +621,13 @@ def test_Storage(setup_test, test_leaks):
     y, x_s, y_s, d, h, J = forward(x)
     stop_manager()
 
-    assert len(manager()._cp._refs) == 1
-    assert tuple(manager()._cp._refs.keys()) == (function_id(x),)
-    assert len(manager()._cp._cp) == 0
-    assert len(manager()._cp._data) == 4
-    assert tuple(manager()._cp._data.keys()) \
-        == ((function_id(x), 0),
-            (function_id(x_s), 1),
-            (function_id(y), 1),
-            (function_id(y_s), 1))
+    cp = manager()._cp
+    assert tuple(cp._refs.keys()) == (function_id(x),)
+    assert len(cp._cp) == 0
+    assert tuple(cp._data.keys()) == ((function_id(x), 0),
+                                      (function_id(x_s), 1),
+                                      (function_id(y), 1),
+                                      (function_id(y_s), 1))
 
     J_val = J.value()
 
@@ -823,18 +817,17 @@ def test_initial_guess(setup_test, test_leaks):
     x, adj_x_0, z, J = forward(y, x_0=x_0)
     stop_manager()
 
-    assert len(manager()._cp._refs) == 3
-    assert tuple(manager()._cp._refs.keys()) == (function_id(y),
-                                                 function_id(adj_x_0),
-                                                 function_id(zero))
-    assert len(manager()._cp._cp) == 0
-    assert len(manager()._cp._data) == 6
-    assert tuple(manager()._cp._data.keys()) == ((function_id(y), 0),
-                                                 (function_id(x), 2),
-                                                 (function_id(adj_x_0), 0),
-                                                 (function_id(x), 3),
-                                                 (function_id(zero), 0),
-                                                 (function_id(z), 1))
+    cp = manager()._cp
+    assert tuple(cp._refs.keys()) == (function_id(y),
+                                      function_id(adj_x_0),
+                                      function_id(zero))
+    assert len(cp._cp) == 0
+    assert tuple(cp._data.keys()) == ((function_id(y), 0),
+                                      (function_id(x), 2),
+                                      (function_id(adj_x_0), 0),
+                                      (function_id(x), 3),
+                                      (function_id(zero), 0),
+                                      (function_id(z), 1))
 
     dJdx_0, dJdy = compute_gradient(
         J, [x_0, y], adj_ics={z: ZeroFunction(space_1)})
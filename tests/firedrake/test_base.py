@@ -23,8 +23,8 @@ from tlm_adjoint.firedrake import *
 from tlm_adjoint.firedrake import manager as _manager
 from tlm_adjoint.firedrake.backend import backend_Constant, backend_Function
 
-import copy
 import gc
+import itertools
 import logging
 import mpi4py.MPI as MPI
 import numpy as np
@@ -36,12 +36,19 @@ import weakref
 
 __all__ = \
     [
+        "hdf5_file",
         "interpolate_expression",
+        "interpolate_P1",
+        "linf_norm_diff",
 
         "run_example",
         "setup_test",
+        "taylor_test_dJ_ddJ",
         "test_configurations",
         "test_leaks",
+        "unit_cube_mesh",
+        "unit_interval_mesh",
+        "unit_square_mesh",
 
         "ls_parameters_cg",
         "ns_parameters_newton_cg",
@@ -90,17 +97,8 @@ def setup_test():
 
 
 def params_set(names, *values):
-    if len(values) > 1:
-        sub_params = params_set(names[1:], *values[1:])
-        params = []
-        for value in values[0]:
-            for sub_params_ in sub_params:
-                new_params = copy.deepcopy(sub_params_)
-                new_params[names[0]] = value
-                params.append(new_params)
-    else:
-        params = [{names[0]:value} for value in values[0]]
-    return params
+    return [dict(zip(names, params))
+            for params in itertools.product(*values)]
 
 
 @pytest.fixture(params=params_set(["enable_caching", "defer_adjoint_assembly"],
@@ -170,6 +168,64 @@ def test_leaks():
     assert refs == 0
 
 
+@pytest.fixture(scope="module")
+def unit_square_mesh():
+    # Mesh construction is expensive relative to the small test problems, so
+    # share the mesh between the tests in a module
+    mesh = UnitSquareMesh(20, 20)
+    mesh.init()
+    return mesh
+
+
+@pytest.fixture(scope="module")
+def unit_interval_mesh():
+    mesh = UnitIntervalMesh(20)
+    mesh.init()
+    return mesh
+
+
+@pytest.fixture(scope="module")
+def unit_cube_mesh():
+    meshes = {}
+
+    def unit_cube_mesh(N_x, N_y, N_z, overlap_type):
+        key = (N_x, N_y, N_z, overlap_type)
+        if key not in meshes:
+            mesh = UnitCubeMesh(
+                N_x, N_y, N_z,
+                distribution_parameters={"partition": True,
+                                         "overlap_type": overlap_type})
+            mesh.init()
+            meshes[key] = mesh
+        return meshes[key]
+
+    yield unit_cube_mesh
+
+    meshes.clear()
+
+
+@pytest.fixture
+def hdf5_file(request):
+    import h5py
+
+    comm = _manager().comm()
+    if comm.rank == 0:
+        if not os.path.exists("checkpoints~"):
+            os.mkdir("checkpoints~")
+    comm.barrier()
+
+    # The test name is the same on all processes, and distinct between tests
+    filename = os.path.join("checkpoints~", f"{request.node.name:s}.hdf5")
+    if comm.size > 1:
+        h = h5py.File(filename, "w", driver="mpio", comm=comm)
+    else:
+        h = h5py.File(filename, "w")
+
+    yield h
+
+    h.close()
+
+
 def run_example(example, clear_forward_globals=True):
     filename = os.path.join(os.path.dirname(__file__),
                             os.path.pardir, os.path.pardir,
@@ -181,10 +237,87 @@ def run_example(example, clear_forward_globals=True):
         gl["forward"].__globals__.clear()
 
 
+def taylor_test_dJ_ddJ(forward, M, J_val, dJ, ddJ, dM=None, seed=1.0e-2,
+                       size=5):
+    # First and second order Taylor remainder verification, sharing a single
+    # set of perturbed forward calculations. Follows taylor_test, but J is
+    # evaluated once for each perturbation.
+
+    if not isinstance(M, (list, tuple)):
+        if dJ is not None:
+            dJ = [dJ]
+        if dM is not None:
+            dM = [dM]
+        return taylor_test_dJ_ddJ(forward, [M], J_val, dJ, ddJ, dM=dM,
+                                  seed=seed, size=size)
+
+    manager = _manager()
+    M0 = [manager.initial_condition(m) for m in M]
+    M1 = [function_new(m, static=function_is_static(m),
+                       cache=function_is_cached(m),
+                       checkpoint=function_is_checkpointed(m))
+          for m in M]
+    if dM is None:
+        dM = [function_new(m1, static=True) for m1 in M1]
+        for dm in dM:
+            function_set_values(dm, np.random.random(function_local_size(dm)))
+
+    eps = np.array([2 ** -p for p in range(size)], dtype=np.float64)
+    eps = seed * eps * max(1.0, max(function_linf_norm(m0) for m0 in M0))
+
+    J_vals = np.full(eps.shape, np.NAN, dtype=np.float64)
+    for i in range(eps.shape[0]):
+        for m0, m1, dm in zip(M0, M1, dM):
+            function_assign(m1, m0)
+            function_axpy(m1, eps[i], dm)
+        clear_caches()
+        annotation_enabled, tlm_enabled = manager.stop()
+        J_vals[i] = forward(*M1).value()
+        manager.start(annotation=annotation_enabled, tlm=tlm_enabled)
+
+    dJ_dM = sum(function_inner(dj, dm) for dj, dm in zip(dJ, dM))
+    _, _, ddJ = ddJ.action(M0, dM)
+    ddJ_dM = sum(function_inner(ddj, dm) for ddj, dm in zip(ddJ, dM))
+
+    def min_order(error_norms):
+        orders = np.log(error_norms[1:] / error_norms[:-1]) / np.log(0.5)
+        return orders.min()
+
+    min_order_1 = min_order(abs(J_vals - J_val - eps * dJ_dM))
+    min_order_2 = min_order(abs(J_vals - J_val - eps * dJ_dM
+                                - 0.5 * eps * eps * ddJ_dM))
+    return min_order_1, min_order_2
+
+
+def linf_norm_diff(x, y):
+    # Equivalent to the infinity norm of x - y, without constructing a
+    # temporary Function
+    diff = function_get_values(x)
+    # function_get_values may return a read-only view
+    diff = np.subtract(diff, function_get_values(y),
+                       out=diff if diff.flags.writeable else None)
+    np.abs(diff, out=diff)
+    return function_comm(x).allreduce(diff.max(initial=0.0), op=MPI.MAX)
+
+
 def interpolate_expression(F, ex):
     F.interpolate(ex)
 
 
+def interpolate_P1(F, fn):
+    # Interpolation onto a degree 1 continuous Lagrange space, with linear
+    # mesh coordinates. The nodes are then the mesh vertices, and fn is
+    # evaluated directly using NumPy, avoiding kernel generation.
+    space = function_space(F)
+    mesh = space.mesh()
+    cell = mesh.ufl_cell()
+    assert space.ufl_element() == FiniteElement("Lagrange", cell, 1)
+    assert mesh.coordinates.function_space().ufl_element() \
+        == VectorElement("Lagrange", cell, 1)
+    X = mesh.coordinates.dat.data_ro.reshape((function_local_size(F), -1))
+    function_set_values(F, fn(*X.T))
+
+
 ls_parameters_cg = {"ksp_type": "cg",
                     "pc_type": "sor",
                     "ksp_rtol": 1.0e-14,
@@ -27,8 +27,8 @@ import pytest
 
 
 @pytest.mark.firedrake
-def test_clear_caches(setup_test, test_leaks):
-    mesh = UnitIntervalMesh(20)
+def test_clear_caches(setup_test, test_leaks, unit_interval_mesh):
+    mesh = unit_interval_mesh
     space = FunctionSpace(mesh, "Lagrange", 1)
     F = Function(space, name="F", cache=True)
 
@@ -125,7 +125,6 @@ def test_cached_rhs(setup_test, test_leaks,
 
     F = Function(space_1, name="F")
     F_ref = Function(space_1, name="F_ref")
-    error = Function(space_1, name="error")
 
     caches = (assembly_cache(), linear_solver_cache(), local_solver_cache())
 
@@ -151,9 +150,7 @@ def test_cached_rhs(setup_test, test_leaks,
     solve(inner(test_1, trial_1) * dx == b, F_ref, bc,
           solver_parameters=ls_parameters_cg)
 
-    function_assign(error, F_ref)
-    function_axpy(error, -1.0, F)
-    error_norm = function_linf_norm(error)
+    error_norm = linf_norm_diff(F_ref, F)
     info(f"Error norm = {error_norm:.16e}")
     assert error_norm < 1.0e-13
 
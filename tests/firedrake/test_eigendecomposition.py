@@ -28,8 +28,8 @@ import pytest
 
 
 @pytest.mark.firedrake
-def test_HEP(setup_test, test_leaks):
-    mesh = UnitIntervalMesh(20)
+def test_HEP(setup_test, test_leaks, unit_interval_mesh):
+    mesh = unit_interval_mesh
     space = FunctionSpace(mesh, "Lagrange", 1)
     test, trial = TestFunction(space), TrialFunction(space)
 
@@ -52,8 +52,8 @@ def test_HEP(setup_test, test_leaks):
 
 
 @pytest.mark.firedrake
-def test_NHEP(setup_test, test_leaks):
-    mesh = UnitIntervalMesh(20)
+def test_NHEP(setup_test, test_leaks, unit_interval_mesh):
+    mesh = unit_interval_mesh
     space = FunctionSpace(mesh, "Lagrange", 1)
     test, trial = TestFunction(space), TrialFunction(space)
 
@@ -114,10 +114,7 @@ def test_SingleBlockHessian(setup_test):
         _, _, ddJ_opt = H_opt.action(F, zeta)
         _, _, ddJ = H.action(F, zeta)
 
-        error = Function(space, name="error")
-        function_assign(error, ddJ)
-        function_axpy(error, -1.0, ddJ_opt)
-        assert function_linf_norm(error) == 0.0
+        assert linf_norm_diff(ddJ, ddJ_opt) == 0.0
 
     # Test consistency of eigenvalues
 
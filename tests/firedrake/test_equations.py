@@ -25,7 +25,6 @@ from test_base import *
 
 import mpi4py.MPI as MPI
 import numpy as np
-import os
 import pytest
 
 
@@ -67,15 +66,16 @@ def test_AssignmentSolver(setup_test, test_leaks):
     dJs = compute_gradient([J, K], x)
 
     dm = Constant(1.0, name="dm", static=True)
+    # The Hessian manager is reset on each use, and so can be shared
+    hessian_manager = manager().new()
 
     for forward_J, J_val, dJ in [(lambda x: forward(x)[0], J.value(), dJs[0]),
                                  (lambda x: forward(x)[1], K.value(), dJs[1])]:
-        min_order = taylor_test(forward_J, x, J_val=J_val, dJ=dJ, dM=dm)
-        assert min_order > 2.00
-
-        ddJ = Hessian(forward_J)
-        min_order = taylor_test(forward_J, x, J_val=J_val, ddJ=ddJ, dM=dm)
-        assert min_order > 3.00
+        ddJ = Hessian(forward_J, manager=hessian_manager)
+        min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+            forward_J, x, J_val=J_val, dJ=dJ, ddJ=ddJ, dM=dm)
+        assert min_order_1 > 2.00
+        assert min_order_2 > 3.00
 
         min_order = taylor_test_tlm(forward_J, x, tlm_order=1, dMs=(dm,))
         assert min_order > 2.00
@@ -137,15 +137,25 @@ def test_AxpySolver(setup_test, test_leaks):
     assert min_order > 2.00
 
 
+@pytest.fixture(scope="module")
+def DirichletBCSolver_F(unit_square_mesh):
+    # Static, and so shared between test configurations
+    space = FunctionSpace(unit_square_mesh, "Lagrange", 1)
+    F = Function(space, name="F", static=True)
+    interpolate_P1(F, lambda x, y: np.sin(np.pi * x) * np.sin(3.0 * np.pi * y))
+    return F
+
+
 @pytest.mark.firedrake
-def test_DirichletBCSolver(setup_test, test_leaks, test_configurations):
-    mesh = UnitSquareMesh(20, 20)
-    X = SpatialCoordinate(mesh)
-    space = FunctionSpace(mesh, "Lagrange", 1)
+def test_DirichletBCSolver(setup_test, test_leaks, test_configurations,
+                           DirichletBCSolver_F):
+    F = DirichletBCSolver_F
+    space = function_space(F)
     test, trial = TestFunction(space), TrialFunction(space)
-
-    F = Function(space, name="F", static=True)
-    interpolate_expression(F, sin(pi * X[0]) * sin(3.0 * pi * X[1]))
+    # Independent of the control, so constructed once rather than on each
+    # forward run
+    A = inner(grad(test), grad(trial)) * dx
+    bc_0 = HomogeneousDirichletBC(space, "on_boundary")
 
     def forward(bc):
         x_0 = Function(space, name="x_0")
@@ -155,10 +165,8 @@ def test_DirichletBCSolver(setup_test, test_leaks, test_configurations):
         DirichletBCSolver(bc, x_1, "on_boundary").solve()
 
         EquationSolver(
-            inner(grad(test), grad(trial)) * dx
-            == inner(test, F) * dx - inner(grad(test), grad(x_1)) * dx,
-            x_0, HomogeneousDirichletBC(space, "on_boundary"),
-            solver_parameters=ls_parameters_cg).solve()
+            A == inner(test, F) * dx - inner(grad(test), grad(x_1)) * dx,
+            x_0, bc_0, solver_parameters=ls_parameters_cg).solve()
 
         AxpySolver(x_0, 1.0, x_1, x).solve()
 
@@ -178,10 +186,7 @@ def test_DirichletBCSolver(setup_test, test_leaks, test_configurations):
           x_ref,
           DirichletBC(space, 1.0, "on_boundary"),
           solver_parameters=ls_parameters_cg)
-    error = Function(space, name="error")
-    function_assign(error, x_ref)
-    function_axpy(error, -1.0, x)
-    assert function_linf_norm(error) < 1.0e-14
+    assert linf_norm_diff(x_ref, x) < 1.0e-14
 
     J_val = J.value()
 
@@ -190,12 +195,11 @@ def test_DirichletBCSolver(setup_test, test_leaks, test_configurations):
     def forward_J(bc):
         return forward(bc)[1]
 
-    min_order = taylor_test(forward_J, bc, J_val=J_val, dJ=dJ)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward_J)
-    min_order = taylor_test(forward_J, bc, J_val=J_val, ddJ=ddJ)
-    assert min_order > 3.00
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward_J, bc, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 3.00
 
     min_order = taylor_test_tlm(forward_J, bc, tlm_order=1)
     assert min_order > 2.00
@@ -241,17 +245,18 @@ def test_FixedPointSolver(setup_test, test_leaks):
     dJda, dJdb = compute_gradient(J, [a, b])
 
     dm = Constant(1.0, name="dm", static=True)
+    # The Hessian manager is reset on each use, and so can be shared
+    hessian_manager = manager().new()
 
     for M, dM, forward_J, dJ in \
             [(a, dm, lambda a: forward(a, b), dJda),
              (b, dm, lambda b: forward(a, b), dJdb),
              ((a, b), (dm, dm), forward, (dJda, dJdb))]:
-        min_order = taylor_test(forward_J, M, J_val=J_val, dJ=dJ, dM=dM)
-        assert min_order > 1.99
-
-        ddJ = Hessian(forward_J)
-        min_order = taylor_test(forward_J, M, J_val=J_val, ddJ=ddJ, dM=dM)
-        assert min_order > 2.99
+        ddJ = Hessian(forward_J, manager=hessian_manager)
+        min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+            forward_J, M, J_val=J_val, dJ=dJ, ddJ=ddJ, dM=dM)
+        assert min_order_1 > 1.99
+        assert min_order_2 > 2.99
 
         min_order = taylor_test_tlm(forward_J, M, tlm_order=1, dMs=(dM,))
         assert min_order > 1.99
@@ -278,12 +283,10 @@ def test_FixedPointSolver(setup_test, test_leaks):
                                                   reason="parallel only"))])
 @pytest.mark.parametrize("N_x, N_y, N_z", [(2, 2, 2),
                                            (5, 5, 5)])
-def test_PointInterpolationSolver(setup_test, test_leaks,
+def test_PointInterpolationSolver(setup_test, test_leaks, unit_cube_mesh,
                                   overlap_type,
                                   N_x, N_y, N_z):
-    mesh = UnitCubeMesh(N_x, N_y, N_z,
-                        distribution_parameters={"partition": True,
-                                                 "overlap_type": overlap_type})
+    mesh = unit_cube_mesh(N_x, N_y, N_z, overlap_type)
     X = SpatialCoordinate(mesh)
     y_space = FunctionSpace(mesh, "Lagrange", 3)
     X_coords = np.array([[0.1, 0.1, 0.1],
@@ -302,10 +305,9 @@ def test_PointInterpolationSolver(setup_test, test_leaks,
         P[0] = eq._P
 
         J = Functional(name="J")
-        for x in X_vals:
-            term = new_real_function()
-            ExprEvaluationSolver(x ** 3, term).solve()
-            J.addto(term)
+        J_term = new_real_function()
+        ExprEvaluationSolver(sum(x ** 3 for x in X_vals), J_term).solve()
+        J.addto(J_term)
         return X_vals, J
 
     y = Function(y_space, name="y", static=True)
@@ -315,13 +317,10 @@ def test_PointInterpolationSolver(setup_test, test_leaks,
     X_vals, J = forward(y)
     stop_manager()
 
-    def x_ref(x):
-        return x[0] ** 3 - 1.5 * x[0] * x[1] + 1.5
-
-    x_error_norm = 0.0
-    for x, x_coord in zip(X_vals, X_coords):
-        x_error_norm = max(x_error_norm,
-                           abs(real_function_value(x) - x_ref(x_coord)))
+    x_vals = np.fromiter(map(real_function_value, X_vals),
+                         dtype=np.float64, count=len(X_vals))
+    x_ref = X_coords[:, 0] ** 3 - 1.5 * X_coords[:, 0] * X_coords[:, 1] + 1.5
+    x_error_norm = abs(x_vals - x_ref).max()
     info(f"Error norm = {x_error_norm:.16e}")
     assert x_error_norm < 1.0e-13
 
@@ -332,12 +331,11 @@ def test_PointInterpolationSolver(setup_test, test_leaks,
     def forward_J(y):
         return forward(y)[1]
 
-    min_order = taylor_test(forward_J, y, J_val=J_val, dJ=dJ)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward_J)
-    min_order = taylor_test(forward_J, y, J_val=J_val, ddJ=ddJ)
-    assert min_order > 2.99
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward_J, y, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 2.99
 
     min_order = taylor_test_tlm(forward_J, y, tlm_order=1)
     assert min_order > 2.00
@@ -350,8 +348,8 @@ def test_PointInterpolationSolver(setup_test, test_leaks,
 
 
 @pytest.mark.firedrake
-def test_ExprEvaluationSolver(setup_test, test_leaks):
-    mesh = UnitIntervalMesh(20)
+def test_ExprEvaluationSolver(setup_test, test_leaks, unit_interval_mesh):
+    mesh = unit_interval_mesh
     X = SpatialCoordinate(mesh)
     space = FunctionSpace(mesh, "Lagrange", 1)
 
@@ -388,12 +386,11 @@ def test_ExprEvaluationSolver(setup_test, test_leaks):
     def forward_J(y):
         return forward(y)[1]
 
-    min_order = taylor_test(forward_J, y, J_val=J_val, dJ=dJ)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward_J)
-    min_order = taylor_test(forward_J, y, J_val=J_val, ddJ=ddJ)
-    assert min_order > 3.00
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward_J, y, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 3.00
 
     min_order = taylor_test_tlm(forward_J, y, tlm_order=1)
     assert min_order > 2.00
@@ -431,11 +428,7 @@ def test_LocalProjectionSolver(setup_test, test_leaks):
     F_ref = Function(space_1, name="F_ref")
     solve(inner(test_1, trial_1) * dx == inner(test_1, G) * dx, F_ref,
           solver_parameters=ls_parameters_cg)
-    F_error = Function(space_1, name="F_error")
-    function_assign(F_error, F_ref)
-    function_axpy(F_error, -1.0, F)
-
-    F_error_norm = function_linf_norm(F_error)
+    F_error_norm = linf_norm_diff(F_ref, F)
     info(f"Error norm = {F_error_norm:.16e}")
     assert F_error_norm < 1.0e-14
 
@@ -446,12 +439,11 @@ def test_LocalProjectionSolver(setup_test, test_leaks):
     def forward_J(G):
         return forward(G)[1]
 
-    min_order = taylor_test(forward_J, G, J_val=J_val, dJ=dJ)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward_J)
-    min_order = taylor_test(forward_J, G, J_val=J_val, ddJ=ddJ)
-    assert min_order > 2.99
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward_J, G, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 2.99
 
     min_order = taylor_test_tlm(forward_J, G, tlm_order=1)
     assert min_order > 2.00
@@ -464,8 +456,8 @@ def test_LocalProjectionSolver(setup_test, test_leaks):
 
 
 @pytest.mark.firedrake
-def test_AssembleSolver(setup_test, test_leaks):
-    mesh = UnitSquareMesh(20, 20)
+def test_AssembleSolver(setup_test, test_leaks, unit_square_mesh):
+    mesh = unit_square_mesh
     X = SpatialCoordinate(mesh)
     space = FunctionSpace(mesh, "Lagrange", 1)
     test = TestFunction(space)
@@ -492,12 +484,11 @@ def test_AssembleSolver(setup_test, test_leaks):
 
     dJ = compute_gradient(J, F)
 
-    min_order = taylor_test(forward, F, J_val=J_val, dJ=dJ)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward)
-    min_order = taylor_test(forward, F, J_val=J_val, ddJ=ddJ)
-    assert min_order > 2.99
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward, F, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 2.99
 
     min_order = taylor_test_tlm(forward, F, tlm_order=1)
     assert min_order > 2.00
@@ -510,14 +501,8 @@ def test_AssembleSolver(setup_test, test_leaks):
 
 
 @pytest.mark.firedrake
-def test_Storage(setup_test, test_leaks):
-    comm = manager().comm()
-    if comm.rank == 0:
-        if not os.path.exists("checkpoints~"):
-            os.mkdir("checkpoints~")
-    comm.barrier()
-
-    mesh = UnitSquareMesh(20, 20)
+def test_Storage(setup_test, test_leaks, unit_square_mesh, hdf5_file):
+    mesh = unit_square_mesh
     X = SpatialCoordinate(mesh)
     space = FunctionSpace(mesh, "Lagrange", 1)
 
@@ -535,13 +520,7 @@ def test_Storage(setup_test, test_leaks):
 
         if h is None:
             function_assign(y_s, y)
-            import h5py
-            if comm.size > 1:
-                h = h5py.File(os.path.join("checkpoints~", "storage.hdf5"),
-                              "w", driver="mpio", comm=comm)
-            else:
-                h = h5py.File(os.path.join("checkpoints~", "storage.hdf5"),
-                              "w")
+            h = hdf5_file
         HDF5Storage(y_s, h, function_name(y_s), save=True).solve()
 
         J = Functional(name="J")
@@ -555,15 +534,13 @@ def test_Storage(setup_test, test_leaks):
     y, x_s, y_s, d, h, J = forward(x)
     stop_manager()
 
-    assert len(manager()._cp._refs) == 1
-    assert tuple(manager()._cp._refs.keys()) == (function_id(x),)
-    assert len(manager()._cp._cp) == 0
-    assert len(manager()._cp._data) == 4
-    assert tuple(manager()._cp._data.keys()) \
-        == ((function_id(x), 0),
-            (function_id(x_s), 1),
-            (function_id(y), 1),
-            (function_id(y_s), 1))
+    cp = manager()._cp
+    assert tuple(cp._refs.keys()) == (function_id(x),)
+    assert len(cp._cp) == 0
+    assert tuple(cp._data.keys()) == ((function_id(x), 0),
+                                      (function_id(x_s), 1),
+                                      (function_id(y), 1),
+                                      (function_id(y_s), 1))
 
     J_val = J.value()
 
@@ -572,12 +549,11 @@ def test_Storage(setup_test, test_leaks):
 
     dJ = compute_gradient(J, x)
 
-    min_order = taylor_test(forward_J, x, J_val=J_val, dJ=dJ)
-    assert min_order > 1.99
-
     ddJ = Hessian(forward_J)
-    min_order = taylor_test(forward_J, x, J_val=J_val, ddJ=ddJ)
-    assert min_order > 2.99
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward_J, x, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 1.99
+    assert min_order_2 > 2.99
 
     min_order = taylor_test_tlm(forward_J, x, tlm_order=1)
     assert min_order > 2.00
@@ -588,8 +564,6 @@ def test_Storage(setup_test, test_leaks):
     min_order = taylor_test_tlm_adjoint(forward_J, x, adjoint_order=2)
     assert min_order > 1.99
 
-    h.close()
-
 
 @pytest.mark.firedrake
 def test_SumSolver(setup_test, test_leaks):
@@ -643,8 +617,8 @@ def test_InnerProductSolver(setup_test, test_leaks):
 
 
 @pytest.mark.firedrake
-def test_initial_guess(setup_test, test_leaks):
-    mesh = UnitSquareMesh(20, 20)
+def test_initial_guess(setup_test, test_leaks, unit_square_mesh):
+    mesh = unit_square_mesh
     X = SpatialCoordinate(mesh)
     space_1 = FunctionSpace(mesh, "Lagrange", 1)
     test_1, trial_1 = TestFunction(space_1), TrialFunction(space_1)
@@ -663,7 +637,7 @@ def test_initial_guess(setup_test, test_leaks):
                          solver_parameters={}):
                 assert is_function(y)
                 super().__init__(
-                    inner(TestFunction(x.function_space()), y) * dx, x,
+                    inner(test_1, y) * dx, x,
                     form_compiler_parameters=form_compiler_parameters,
                     solver_parameters=solver_parameters,
                     cache_jacobian=False, cache_rhs_assembly=False)
@@ -756,18 +730,17 @@ def test_initial_guess(setup_test, test_leaks):
     x, adj_x_0, z, J = forward(y, x_0=x_0)
     stop_manager()
 
-    assert len(manager()._cp._refs) == 3
-    assert tuple(manager()._cp._refs.keys()) == (function_id(y),
-                                                 function_id(adj_x_0),
-                                                 function_id(zero))
-    assert len(manager()._cp._cp) == 0
-    assert len(manager()._cp._data) == 6
-    assert tuple(manager()._cp._data.keys()) == ((function_id(y), 0),
-                                                 (function_id(x), 2),
-                                                 (function_id(adj_x_0), 0),
-                                                 (function_id(x), 3),
-                                                 (function_id(zero), 0),
-                                                 (function_id(z), 1))
+    cp = manager()._cp
+    assert tuple(cp._refs.keys()) == (function_id(y),
+                                      function_id(adj_x_0),
+                                      function_id(zero))
+    assert len(cp._cp) == 0
+    assert tuple(cp._data.keys()) == ((function_id(y), 0),
+                                      (function_id(x), 2),
+                                      (function_id(adj_x_0), 0),
+                                      (function_id(x), 3),
+                                      (function_id(zero), 0),
+                                      (function_id(z), 1))
 
     dJdx_0, dJdy = compute_gradient(
         J, [x_0, y], adj_ics={z: ZeroFunction(space_1)})
@@ -779,12 +752,11 @@ def test_initial_guess(setup_test, test_leaks):
     def forward_J(y):
         return forward(y)[3]
 
-    min_order = taylor_test(forward_J, y, J_val=J_val, dJ=dJdy)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward_J)
-    min_order = taylor_test(forward_J, y, J_val=J_val, ddJ=ddJ)
-    assert min_order > 3.00
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward_J, y, J_val=J_val, dJ=dJdy, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 3.00
 
     min_order = taylor_test_tlm(forward_J, y, tlm_order=1)
     assert min_order > 2.00
@@ -797,12 +769,15 @@ def test_initial_guess(setup_test, test_leaks):
 
 
 @pytest.mark.firedrake
+@pytest.mark.parametrize("cache_jacobian", [True, False])
 @pytest.mark.parametrize("cache_rhs_assembly", [True, False])
 def test_EquationSolver_form_binding_bc(setup_test, test_leaks,
-                                        cache_rhs_assembly):
-    mesh = UnitSquareMesh(20, 20)
+                                        unit_square_mesh,
+                                        cache_jacobian, cache_rhs_assembly):
+    mesh = unit_square_mesh
     space = FunctionSpace(mesh, "Lagrange", 1)
     test, trial = TestFunction(space), TrialFunction(space)
+    zero = Constant(0.0)
 
     def forward(m):
         class CustomEquationSolver(EquationSolver):
@@ -812,10 +787,10 @@ def test_EquationSolver_form_binding_bc(setup_test, test_leaks,
 
         x = Function(space, name="x")
         CustomEquationSolver(
-            inner(test, m * trial) * dx == inner(test, Constant(0.0)) * dx,
+            inner(test, m * trial) * dx == inner(test, zero) * dx,
             x, DirichletBC(space, 1.0, "on_boundary"),
             solver_parameters=ls_parameters_cg,
-            cache_jacobian=False,
+            cache_jacobian=cache_jacobian,
             cache_rhs_assembly=cache_rhs_assembly).solve()
 
         J = Functional(name="J")
@@ -834,12 +809,11 @@ def test_EquationSolver_form_binding_bc(setup_test, test_leaks,
 
     dJ = compute_gradient(J, m)
 
-    min_order = taylor_test(forward, m, J_val=J_val, dJ=dJ)
-    assert min_order > 1.99
-
     ddJ = Hessian(forward)
-    min_order = taylor_test(forward, m, J_val=J_val, ddJ=ddJ)
-    assert min_order > 2.99
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward, m, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 1.99
+    assert min_order_2 > 2.99
 
     min_order = taylor_test_tlm(forward, m, tlm_order=1)
     assert min_order > 1.99
@@ -882,12 +856,11 @@ def test_ZeroFunction(setup_test, test_leaks, test_configurations):
 
     J_val = J.value()
 
-    min_order = taylor_test(forward, m, J_val=J_val, dJ=dJ)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward)
-    min_order = taylor_test(forward, m, J_val=J_val, ddJ=ddJ)
-    assert min_order > 3.00
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward, m, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 3.00
 
     min_order = taylor_test_tlm(forward, m, tlm_order=1)
     assert min_order > 2.00
@@ -31,13 +31,13 @@ import pytest
 
 
 @pytest.mark.firedrake
-def test_long_range(setup_test, test_leaks):
+def test_long_range(setup_test, test_leaks, unit_interval_mesh):
     n_steps = 200
     configure_checkpointing("multistage",
                             {"blocks": n_steps, "snaps_on_disk": 0,
                              "snaps_in_ram": 2})
 
-    mesh = UnitIntervalMesh(20)
+    mesh = unit_interval_mesh
     X = SpatialCoordinate(mesh)
     space = FunctionSpace(mesh, "Lagrange", 1)
 
@@ -254,13 +254,13 @@ def test_diffusion_1d_timestepping(setup_test, test_leaks,
 
 
 @pytest.mark.firedrake
-def test_diffusion_2d(setup_test, test_leaks):
+def test_diffusion_2d(setup_test, test_leaks, unit_square_mesh):
     n_steps = 20
     configure_checkpointing("multistage",
                             {"blocks": n_steps, "snaps_on_disk": 2,
                              "snaps_in_ram": 3})
 
-    mesh = UnitSquareMesh(20, 20)
+    mesh = unit_square_mesh
     X = SpatialCoordinate(mesh)
     space = FunctionSpace(mesh, "Lagrange", 1)
     test, trial = TestFunction(space), TrialFunction(space)
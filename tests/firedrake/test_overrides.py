@@ -23,21 +23,26 @@ from tlm_adjoint.firedrake import *
 
 from test_base import *
 
+import numpy as np
 import pytest
 
 
 @pytest.mark.firedrake
-def test_overrides(setup_test, test_leaks):
-    mesh = UnitSquareMesh(20, 20)
-    X = SpatialCoordinate(mesh)
+def test_overrides(setup_test, test_leaks, unit_square_mesh):
+    mesh = unit_square_mesh
     space = FunctionSpace(mesh, "Lagrange", 1)
     test, trial = TestFunction(space), TrialFunction(space)
 
     F = Function(space, name="F", static=True)
-    interpolate_expression(F, sin(pi * X[0]) * sin(3.0 * pi * X[1]))
+    interpolate_P1(F, lambda x, y: np.sin(np.pi * x) * np.sin(3.0 * np.pi * y))
 
     bc = DirichletBC(space, 1.0, "on_boundary")
 
+    # Independent of the control, and so constructed once and shared by the
+    # projection variants and the Taylor verification forward runs
+    M = inner(test, trial) * dx
+    A = assemble(M, bcs=bc)
+
     def project_project(F):
         return project(F, space, bcs=bc, name="G",
                        solver_parameters=ls_parameters_cg)
@@ -45,7 +50,6 @@ def test_overrides(setup_test, test_leaks):
     def project_assemble_LinearSolver(F):
         G = Function(space, name="G")
 
-        A = assemble(inner(test, trial) * dx, bcs=bc)
         b = assemble(inner(test, F) * dx)
 
         solver = LinearSolver(A, solver_parameters=ls_parameters_cg)
@@ -56,8 +60,8 @@ def test_overrides(setup_test, test_leaks):
     def project_LinearVariationalSolver(F):
         G = Function(space, name="G")
 
-        eq = inner(test, trial) * dx == inner(test, F) * dx
-        problem = LinearVariationalProblem(eq.lhs, eq.rhs, G, bcs=bc)
+        problem = LinearVariationalProblem(M, inner(test, F) * dx, G,
+                                           bcs=bc, constant_jacobian=True)
         solver = LinearVariationalSolver(
             problem, solver_parameters=ls_parameters_cg)
         solver.solve()
@@ -68,9 +72,7 @@ def test_overrides(setup_test, test_leaks):
         G = Function(space, name="G")
 
         eq = inner(test, G) * dx - inner(test, F) * dx
-        problem = NonlinearVariationalProblem(eq, G,
-                                              J=inner(test, trial) * dx,
-                                              bcs=bc)
+        problem = NonlinearVariationalProblem(eq, G, J=M, bcs=bc)
         solver = NonlinearVariationalSolver(
             problem, solver_parameters=ns_parameters_newton_cg)
         solver.solve()
@@ -94,10 +96,9 @@ def test_overrides(setup_test, test_leaks):
         stop_manager()
 
         error = Function(space, name="error")
-        solve(inner(test, trial) * dx == inner(test, F) * dx,
+        solve(M == inner(test, F) * dx,
               error, bc, solver_parameters=ls_parameters_cg)
-        function_axpy(error, -1.0, G)
-        assert function_linf_norm(error) < 1.0e-14
+        assert linf_norm_diff(error, G) < 1.0e-14
 
         J_val = J.value()
 
@@ -106,12 +107,11 @@ def test_overrides(setup_test, test_leaks):
         def forward_J(F):
             return forward(F)[1]
 
-        min_order = taylor_test(forward_J, F, J_val=J_val, dJ=dJ)
-        assert min_order > 2.00
-
         ddJ = Hessian(forward_J)
-        min_order = taylor_test(forward_J, F, J_val=J_val, ddJ=ddJ)
-        assert min_order > 2.99
+        min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+            forward_J, F, J_val=J_val, dJ=dJ, ddJ=ddJ)
+        assert min_order_1 > 2.00
+        assert min_order_2 > 2.99
 
         min_order = taylor_test_tlm(forward_J, F, tlm_order=1)
         assert min_order > 2.00
@@ -124,11 +124,11 @@ def test_overrides(setup_test, test_leaks):
 
 
 @pytest.mark.firedrake
-def test_Nullspace(setup_test, test_leaks):
-    mesh = UnitSquareMesh(20, 20)
-    X = SpatialCoordinate(mesh)
+def test_Nullspace(setup_test, test_leaks, unit_square_mesh):
+    mesh = unit_square_mesh
     space = FunctionSpace(mesh, "Lagrange", 1)
     test, trial = TestFunction(space), TrialFunction(space)
+    nullspace = VectorSpaceBasis(constant=True)
 
     def forward(F):
         psi = Function(space, name="psi")
@@ -136,8 +136,7 @@ def test_Nullspace(setup_test, test_leaks):
         solve(inner(grad(test), grad(trial)) * dx
               == -inner(test, F * F) * dx, psi,
               solver_parameters=ls_parameters_cg,
-              nullspace=VectorSpaceBasis(constant=True),
-              transpose_nullspace=VectorSpaceBasis(constant=True))
+              nullspace=nullspace, transpose_nullspace=nullspace)
 
         J = Functional(name="J")
         J.assign(inner(psi * psi, psi * psi) * dx
@@ -146,7 +145,7 @@ def test_Nullspace(setup_test, test_leaks):
         return psi, J
 
     F = Function(space, name="F", static=True)
-    interpolate_expression(F, sqrt(sin(pi * X[1])))
+    interpolate_P1(F, lambda x, y: np.sqrt(np.sin(np.pi * y)))
 
     start_manager()
     psi, J = forward(F)
@@ -161,12 +160,11 @@ def test_Nullspace(setup_test, test_leaks):
     def forward_J(F):
         return forward(F)[1]
 
-    min_order = taylor_test(forward_J, F, J_val=J_val, dJ=dJ)
-    assert min_order > 2.00
-
     ddJ = Hessian(forward_J)
-    min_order = taylor_test(forward_J, F, J_val=J_val, ddJ=ddJ)
-    assert min_order > 3.00
+    min_order_1, min_order_2 = taylor_test_dJ_ddJ(
+        forward_J, F, J_val=J_val, dJ=dJ, ddJ=ddJ)
+    assert min_order_1 > 2.00
+    assert min_order_2 > 3.00
 
     min_order = taylor_test_tlm(forward_J, F, tlm_order=1)
     assert min_order > 2.00
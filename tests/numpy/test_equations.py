@@ -232,3 +232,44 @@ def test_ContractionSolver(setup_test, test_leaks):
 
     min_order = taylor_test_tlm_adjoint(forward_J, m, adjoint_order=2)
     assert min_order > 2.00
+
+
+@pytest.mark.numpy
+def test_ConstantMatrix(setup_test, test_leaks):
+    space = FunctionSpace(3)
+    A = np.array([[2.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 4.0]],
+                 dtype=np.float64)
+
+    def forward(m):
+        x = Function(space, name="x")
+        LinearEquation(ContractionRHS(np.eye(3), (1,), (m,)), x,
+                       A=ConstantMatrix(A)).solve()
+
+        J = Functional(name="J")
+        NormSqSolver(x, J.fn()).solve()
+        return x, J
+
+    m = Function(space, name="m", static=True)
+    function_set_values(m, np.array([7.0, 8.0, 9.0], dtype=np.float64))
+
+    start_manager()
+    x, J = forward(m)
+    stop_manager()
+
+    assert abs(A.dot(x.vector()) - m.vector()).max() < 1.0e-14
+
+    J_val = J.value()
+
+    dJ = compute_gradient(J, m)
+
+    def forward_J(m):
+        return forward(m)[1]
+
+    min_order = taylor_test(forward_J, m, J_val=J_val, dJ=dJ)
+    assert min_order > 1.99
+
+    min_order = taylor_test_tlm(forward_J, m, tlm_order=1)
+    assert min_order > 1.99
+
+    min_order = taylor_test_tlm_adjoint(forward_J, m, adjoint_order=1)
+    assert min_order > 1.99
@@ -33,6 +33,7 @@ import mpi4py.MPI as MPI
 import numpy as np
 import ufl
 import warnings
+import weakref
 
 __all__ = \
     [
@@ -54,6 +55,15 @@ __all__ = \
     ]
 
 
+def ufl_domain(x):
+    domains = x.ufl_domains()
+    if len(domains) == 0:
+        return None
+    else:
+        domain, = domains
+        return domain
+
+
 def new_count():
     c = backend_Constant.__new__(backend_Constant, 0.0)
     backend_Constant._tlm_adjoint__orig___init__(c, 0.0)
@@ -106,9 +116,11 @@ class ConstantInterface(_FunctionInterface):
         return self._tlm_adjoint__function_interface_attrs["checkpoint"]
 
     def _caches(self):
-        if not hasattr(self, "_tlm_adjoint__caches"):
-            self._tlm_adjoint__caches = Caches(self)
-        return self._tlm_adjoint__caches
+        try:
+            return self._tlm_adjoint__caches
+        except AttributeError:
+            caches = self._tlm_adjoint__caches = Caches(self)
+            return caches
 
     def _update_caches(self, value=None):
         if value is None:
@@ -150,47 +162,54 @@ class ConstantInterface(_FunctionInterface):
             if len(self.ufl_shape) == 0:
                 value = float(self) + alpha * float(x)
             else:
-                value = self.values() + alpha * x.values()
+                # alpha * x.values() is a new array, and so can be updated in
+                # place
+                value = alpha * x.values()
+                value += self.values()
                 value.shape = self.ufl_shape
                 value = backend_Constant(value)
         self.assign(value)  # annotate=False, tlm=False
 
     def _inner(self, y):
         assert isinstance(y, backend_Constant)
-        return self.values().dot(y.values())
+        if len(self.ufl_shape) == 0:
+            return float(self) * float(y)
+        else:
+            return self.values().dot(y.values())
 
     def _max_value(self):
-        return self.values().max()
+        if len(self.ufl_shape) == 0:
+            return float(self)
+        else:
+            return self.values().max()
 
     def _sum(self):
-        return self.values().sum()
+        if len(self.ufl_shape) == 0:
+            return float(self)
+        else:
+            return self.values().sum()
 
     def _linf_norm(self):
-        return abs(self.values()).max()
+        if len(self.ufl_shape) == 0:
+            return abs(float(self))
+        else:
+            return abs(self.values()).max()
 
     def _local_size(self):
         comm = function_comm(self)
         if comm.rank == 0:
-            if len(self.ufl_shape) == 0:
-                return 1
-            else:
-                return np.prod(self.ufl_shape)
+            return self._tlm_adjoint__function_interface_attrs["size"]
         else:
             return 0
 
     def _global_size(self):
-        if len(self.ufl_shape) == 0:
-            return 1
-        else:
-            return np.prod(self.ufl_shape)
+        return self._tlm_adjoint__function_interface_attrs["size"]
 
     def _local_indices(self):
         comm = function_comm(self)
         if comm.rank == 0:
-            if len(self.ufl_shape) == 0:
-                return slice(0, 1)
-            else:
-                return slice(0, np.prod(self.ufl_shape))
+            n = self._tlm_adjoint__function_interface_attrs["size"]
+            return slice(0, n)
         else:
             return slice(0, 0)
 
@@ -209,12 +228,13 @@ class ConstantInterface(_FunctionInterface):
         if not np.can_cast(values, backend_ScalarType):
             raise InterfaceException("Invalid dtype")
         comm = function_comm(self)
-        if comm.rank != 0:
-            if len(self.ufl_shape) == 0:
-                values = np.array([0.0], dtype=np.float64)
-            else:
-                values = np.zeros(np.prod(self.ufl_shape), dtype=np.float64)
-        values = comm.bcast(values, root=0)
+        if comm.rank == 0:
+            values = np.array(values, dtype=np.float64)
+        else:
+            n = self._tlm_adjoint__function_interface_attrs["size"]
+            values = np.zeros(n, dtype=np.float64)
+        if comm.size > 1:
+            comm.Bcast(values, root=0)
         if len(self.ufl_shape) == 0:
             values.shape = (1,)
             self.assign(values[0])  # annotate=False, tlm=False
@@ -223,11 +243,7 @@ class ConstantInterface(_FunctionInterface):
             self.assign(backend_Constant(values))  # annotate=False, tlm=False
 
     def _new(self, name=None, static=False, cache=None, checkpoint=None):
-        domains = self.ufl_domains()
-        if len(domains) == 0:
-            domain = None
-        else:
-            domain, = domains
+        domain = ufl_domain(self)
         space = self._tlm_adjoint__function_interface_attrs["space"]
         comm = function_comm(self)
         return Constant(name=name, domain=domain, space=space, comm=comm,
@@ -239,11 +255,7 @@ class ConstantInterface(_FunctionInterface):
         else:
             value = self.values().view()
             value.shape = self.ufl_shape
-        domains = self.ufl_domains()
-        if len(domains) == 0:
-            domain = None
-        else:
-            domain, = domains
+        domain = ufl_domain(self)
         space = self._tlm_adjoint__function_interface_attrs["space"]
         comm = function_comm(self)
         return Constant(value, name=name, domain=domain, space=space,
@@ -254,11 +266,7 @@ class ConstantInterface(_FunctionInterface):
         if function_is_static(self):
             return None
         else:
-            domains = self.ufl_domains()
-            if len(domains) == 0:
-                domain = None
-            else:
-                domain, = domains
+            domain = ufl_domain(self)
             space = self._tlm_adjoint__function_interface_attrs["space"]
             comm = function_comm(self)
             return Constant(name=name, domain=domain, space=space, comm=comm,
@@ -266,11 +274,8 @@ class ConstantInterface(_FunctionInterface):
                             checkpoint=function_is_checkpointed(self))
 
     def _replacement(self):
-        if not hasattr(self, "_tlm_adjoint__replacement"):
-            # Firedrake requires Constant.function_space() to return None
-            self._tlm_adjoint__replacement = \
-                Replacement(self, space=None)
-        return self._tlm_adjoint__replacement
+        # Firedrake requires Constant.function_space() to return None
+        return cached_replacement(self, space=None)
 
     def _is_replacement(self):
         return False
@@ -397,6 +402,22 @@ def extract_coefficients(expr):
 
 
 def eliminate_zeros(expr, force_non_empty_form=False):
+    if isinstance(expr, ufl.classes.Form):
+        # Zero functions are immutable, so the result can be cached on the
+        # form
+        key = ("_tlm_adjoint__simplified_form"
+               if force_non_empty_form
+               else "_tlm_adjoint__simplified_form_allow_empty")
+        if key not in expr._cache:
+            expr._cache[key] = _eliminate_zeros(
+                expr, force_non_empty_form=force_non_empty_form)
+        return expr._cache[key]
+    else:
+        return _eliminate_zeros(expr,
+                                force_non_empty_form=force_non_empty_form)
+
+
+def _eliminate_zeros(expr, force_non_empty_form=False):
     replace_map = {}
     for c in extract_coefficients(expr):
         if isinstance(c, Zero):
@@ -473,15 +494,17 @@ class DirichletBC(backend_DirichletBC):
 
         if static is None:
             static = True
-            for dep in ufl.algorithms.extract_coefficients(
-                    g if isinstance(g, ufl.classes.Expr)
-                    else backend_Constant(g)):
-                # The 'static' flag for functions is only a hint. 'not
-                # checkpointed' is a guarantee that the function will never
-                # appear as the solution to an Equation.
-                if not is_function(dep) or not function_is_checkpointed(dep):
-                    static = False
-                    break
+            # A non-UFL boundary value (e.g. a float or an array) has no
+            # dependencies
+            if isinstance(g, ufl.classes.Expr):
+                for dep in ufl.algorithms.extract_coefficients(g):
+                    # The 'static' flag for functions is only a hint. 'not
+                    # checkpointed' is a guarantee that the function will
+                    # never appear as the solution to an Equation.
+                    if not is_function(dep) \
+                            or not function_is_checkpointed(dep):
+                        static = False
+                        break
         if cache is None:
             cache = static
         if homogeneous is not None:
@@ -613,11 +636,7 @@ class Replacement(ufl.classes.Coefficient):
             space = function_space(x)
             x_space = space
 
-        x_domains = x.ufl_domains()
-        if len(x_domains) == 0:
-            domain = None
-        else:
-            domain, = x_domains
+        domain = ufl_domain(x)
 
         super().__init__(x_space, count=new_count())
         self.__domain = domain
@@ -677,17 +696,43 @@ class Replacement(ufl.classes.Coefficient):
             return (self.__domain,)
 
 
-def replaced_expr(expr):
+_replacements = weakref.WeakKeyDictionary()
+
+
+def cached_replacement(x, *args, **kwargs):
+    # Cache outside of x, so that no attribute is set on x
+    replacement = _replacements.get(x, None)
+    if replacement is None:
+        replacement = _replacements[x] = Replacement(x, *args, **kwargs)
+    return replacement
+
+
+def _replace_map(coefficients):
     replace_map = {}
-    for c in ufl.algorithms.extract_coefficients(expr):
+    for c in coefficients:
         if is_function(c):
-            replace_map[c] = function_replacement(c)
-    return ufl.replace(expr, replace_map)
+            c_rep = function_replacement(c)
+            if c_rep is not c:
+                replace_map[c] = c_rep
+    return replace_map
+
+
+def replaced_expr(expr):
+    replace_map = _replace_map(ufl.algorithms.extract_coefficients(expr))
+    if len(replace_map) == 0:
+        return expr
+    else:
+        return ufl.replace(expr, replace_map)
 
 
 def replaced_form(form):
-    replace_map = {}
-    for c in form.coefficients():
-        if is_function(c):
-            replace_map[c] = function_replacement(c)
-    return ufl.replace(form, replace_map)
+    # Replacements are cached on functions, so the result can be cached on the
+    # form
+    if "_tlm_adjoint__replaced_form" not in form._cache:
+        replace_map = _replace_map(form.coefficients())
+        if len(replace_map) == 0:
+            form._cache["_tlm_adjoint__replaced_form"] = form
+        else:
+            form._cache["_tlm_adjoint__replaced_form"] = \
+                ufl.replace(form, replace_map)
+    return form._cache["_tlm_adjoint__replaced_form"]
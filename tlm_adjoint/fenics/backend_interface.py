@@ -27,7 +27,7 @@ from ..interface import InterfaceException, SpaceInterface, \
     add_subtract_adjoint_derivative_action, add_time_system_eq, \
     function_caches, function_copy, function_is_cached, \
     function_is_checkpointed, function_is_static, function_new, \
-    new_function_id, new_space_id, space_id, space_new, \
+    new_function_id, new_space_id, space_comm, space_id, space_new, \
     subtract_adjoint_derivative_action, weakref_method
 from ..interface import FunctionInterface as _FunctionInterface
 from .backend_code_generator_interface import assemble, is_valid_r0_space, \
@@ -36,7 +36,7 @@ from .backend_code_generator_interface import assemble, is_valid_r0_space, \
 from .caches import form_neg
 from .equations import AssembleSolver, EquationSolver
 from .functions import Caches, Constant, ConstantInterface, \
-    ConstantSpaceInterface, Function, Replacement, Zero
+    ConstantSpaceInterface, Function, Zero, cached_replacement
 
 import mpi4py.MPI as MPI
 import numpy as np
@@ -73,6 +73,7 @@ def _Constant__init__(self, *args, domain=None, space=None,
                       {"comm": comm, "domain": domain, "id": new_space_id()})
     add_interface(self, ConstantInterface,
                   {"id": new_function_id(), "state": 0, "space": space,
+                   "size": int(np.prod(self.ufl_shape)),
                    "static": False, "cache": False, "checkpoint": True})
 
 
@@ -82,7 +83,7 @@ backend_Constant.__init__ = _Constant__init__
 
 class FunctionSpaceInterface(SpaceInterface):
     def _comm(self):
-        return self.mesh().mpi_comm()
+        return self._tlm_adjoint__space_interface_attrs["comm"]
 
     def _id(self):
         return self._tlm_adjoint__space_interface_attrs["id"]
@@ -109,7 +110,7 @@ def _FunctionSpace__init__(self, *args, **kwargs):
     backend_FunctionSpace._tlm_adjoint__orig___init__(self, *args, **kwargs)
     if _FunctionSpace_add_interface[0]:
         add_interface(self, FunctionSpaceInterface,
-                      {"id": new_space_id()})
+                      {"comm": self.mesh().mpi_comm(), "id": new_space_id()})
 
 
 backend_FunctionSpace._tlm_adjoint__orig___init__ = backend_FunctionSpace.__init__  # noqa: E501
@@ -118,7 +119,7 @@ backend_FunctionSpace.__init__ = _FunctionSpace__init__
 
 class FunctionInterface(_FunctionInterface):
     def _comm(self):
-        return self.function_space().mesh().mpi_comm()
+        return space_comm(self._tlm_adjoint__function_interface_attrs["space"])
 
     def _space(self):
         return self._tlm_adjoint__function_interface_attrs["space"]
@@ -145,9 +146,11 @@ class FunctionInterface(_FunctionInterface):
         return self._tlm_adjoint__function_interface_attrs["checkpoint"]
 
     def _caches(self):
-        if not hasattr(self, "_tlm_adjoint__caches"):
-            self._tlm_adjoint__caches = Caches(self)
-        return self._tlm_adjoint__caches
+        try:
+            return self._tlm_adjoint__caches
+        except AttributeError:
+            caches = self._tlm_adjoint__caches = Caches(self)
+            return caches
 
     def _update_caches(self, value=None):
         if value is None:
@@ -281,9 +284,7 @@ class FunctionInterface(_FunctionInterface):
                                 checkpoint=function_is_checkpointed(self))
 
     def _replacement(self):
-        if not hasattr(self, "_tlm_adjoint__replacement"):
-            self._tlm_adjoint__replacement = Replacement(self)
-        return self._tlm_adjoint__replacement
+        return cached_replacement(self)
 
     def _is_replacement(self):
         return False
@@ -311,7 +312,7 @@ def _Function__init__(self, *args, **kwargs):
     else:
         id = new_space_id()
     add_interface(space, FunctionSpaceInterface,
-                  {"id": id})
+                  {"comm": space.mesh().mpi_comm(), "id": id})
     self._tlm_adjoint__function_interface_attrs["space"] = space
 
 
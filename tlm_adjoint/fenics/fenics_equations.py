@@ -121,27 +121,26 @@ def local_mesh(mesh):
 
 
 def point_cells(coords, mesh):
-    full_cells = np.full(coords.shape[0], -1, dtype=np.int64)
-    distances = np.full(coords.shape[0], np.NAN, dtype=np.float64)
-
     if mesh.mpi_comm().size == 1 or not has_ghost_cells(mesh):
-        full_tree = mesh.bounding_box_tree()
-        for i in range(coords.shape[0]):
-            point = Point(*coords[i, :])
-            full_cell, distance = full_tree.compute_closest_entity(point)
-            full_cells[i] = full_cell
-            distances[i] = distance
+        tree = mesh.bounding_box_tree()
+        full_cell_map = None
     else:
         l_mesh, full_vertex_map, full_cell_map = local_mesh(mesh)
-        local_tree = l_mesh.bounding_box_tree()
-        for i in range(coords.shape[0]):
-            point = Point(*coords[i, :])
-            local_cell, distance = local_tree.compute_closest_entity(point)
-            full_cells[i] = full_cell_map[local_cell]
-            distances[i] = distance
-
-    assert (full_cells[i] >= 0).all()
-    assert (full_cells[i] < mesh.num_cells()).all()
+        tree = l_mesh.bounding_box_tree()
+        full_cell_map = np.array(full_cell_map, dtype=np.int64)
+
+    cells = np.full(coords.shape[0], -1, dtype=np.int64)
+    distances = np.full(coords.shape[0], np.NAN, dtype=np.float64)
+    for i, x in enumerate(coords):
+        cells[i], distances[i] = tree.compute_closest_entity(Point(*x))
+
+    if full_cell_map is None:
+        full_cells = cells
+    else:
+        full_cells = full_cell_map[cells]
+
+    assert (full_cells >= 0).all()
+    assert (full_cells < mesh.num_cells()).all()
     assert (distances >= 0.0).all()
 
     return full_cells, distances
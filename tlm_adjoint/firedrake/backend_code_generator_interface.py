@@ -199,12 +199,7 @@ def _assemble(form, tensor=None, form_compiler_parameters=None,
     if form_compiler_parameters is None:
         form_compiler_parameters = {}
 
-    if "_tlm_adjoint__simplified_form" in form._cache:
-        simplified_form = form._cache["_tlm_adjoint__simplified_form"]
-    else:
-        simplified_form = form._cache["_tlm_adjoint__simplified_form"] = \
-            eliminate_zeros(form, force_non_empty_form=True)
-    form = simplified_form
+    form = eliminate_zeros(form, force_non_empty_form=True)
 
     if "_tlm_adjoint__parloops" in form._cache:
         tensor_id, cache_0, cache_1 = form._cache.pop("_tlm_adjoint__parloops")
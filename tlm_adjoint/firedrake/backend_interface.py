@@ -35,7 +35,7 @@ from .backend_code_generator_interface import assemble, is_valid_r0_space
 from .caches import form_neg
 from .equations import AssembleSolver, EquationSolver
 from .functions import Caches, Constant, ConstantInterface, \
-    ConstantSpaceInterface, Function, Replacement, Zero
+    ConstantSpaceInterface, Function, Zero, cached_replacement
 
 import mpi4py.MPI as MPI
 import numpy as np
@@ -82,7 +82,7 @@ def _Constant__init__(self, value, domain=None, *,
                       {"comm": comm, "domain": domain, "id": new_space_id()})
     add_interface(self, ConstantInterface,
                   {"id": new_function_id(), "name": name, "state": 0,
-                   "space": space,
+                   "space": space, "size": int(np.prod(self.ufl_shape)),
                    "static": False, "cache": False, "checkpoint": True})
 
 
@@ -141,9 +141,11 @@ class FunctionInterface(_FunctionInterface):
         return self._tlm_adjoint__function_interface_attrs["checkpoint"]
 
     def _caches(self):
-        if not hasattr(self, "_tlm_adjoint__caches"):
-            self._tlm_adjoint__caches = Caches(self)
-        return self._tlm_adjoint__caches
+        try:
+            return self._tlm_adjoint__caches
+        except AttributeError:
+            caches = self._tlm_adjoint__caches = Caches(self)
+            return caches
 
     def _update_caches(self, value=None):
         if value is None:
@@ -286,9 +288,7 @@ class FunctionInterface(_FunctionInterface):
                                 checkpoint=function_is_checkpointed(self))
 
     def _replacement(self):
-        if not hasattr(self, "_tlm_adjoint__replacement"):
-            self._tlm_adjoint__replacement = Replacement(self)
-        return self._tlm_adjoint__replacement
+        return cached_replacement(self)
 
     def _is_replacement(self):
         return False
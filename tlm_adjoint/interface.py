@@ -19,6 +19,7 @@
 # along with tlm_adjoint.  If not, see <https://www.gnu.org/licenses/>.
 
 import copy
+import itertools
 import logging
 import sys
 import warnings
@@ -140,13 +141,11 @@ def space_comm(space):
     return space._tlm_adjoint__space_interface_comm()
 
 
-_space_id_counter = [0]
+_space_id_counter = itertools.count()
 
 
 def new_space_id():
-    space_id = _space_id_counter[0]
-    _space_id_counter[0] += 1
-    return space_id
+    return next(_space_id_counter)
 
 
 def space_id(space):
@@ -274,13 +273,11 @@ def function_space(x):
     return x._tlm_adjoint__function_interface_space()
 
 
-_function_id_counter = [0]
+_function_id_counter = itertools.count()
 
 
 def new_function_id():
-    function_id = _function_id_counter[0]
-    _function_id_counter[0] += 1
-    return function_id
+    return next(_function_id_counter)
 
 
 def function_id(x):
@@ -459,9 +456,10 @@ def subtract_adjoint_derivative_action(x, y):
                           type(x._tlm_adjoint__function_interface)):
                 function_axpy(x, -alpha, y)
             else:
-                function_set_values(x,
-                                    function_get_values(x)
-                                    - alpha * function_get_values(y))
+                y_values = function_get_values(y)
+                if alpha != 1.0:
+                    y_values = alpha * y_values
+                function_set_values(x, function_get_values(x) - y_values)
         else:
             raise InterfaceException("Unexpected case encountered in "
                                      "subtract_adjoint_derivative_action")
@@ -28,6 +28,12 @@ import copy
 import numpy as np
 import warnings
 
+try:
+    from scipy.linalg.blas import daxpy as _daxpy, ddot as _ddot
+except ImportError:
+    _daxpy = None
+    _ddot = None
+
 __all__ = \
     [
         "Function",
@@ -109,59 +115,73 @@ class FunctionInterface(_FunctionInterface):
         pass
 
     def _zero(self):
-        self.vector()[:] = 0.0
+        self._data.fill(0.0)
 
     def _assign(self, y):
-        if isinstance(y, (int, float)):
-            self.vector()[:] = float(y)
+        if isinstance(y, Function):
+            np.copyto(self._data, y._data)
         else:
-            assert isinstance(y, Function)
-            self.vector()[:] = y.vector()
+            assert isinstance(y, (int, float))
+            self._data.fill(float(y))
 
     def _axpy(self, *args):  # self, alpha, x
         alpha, x = args
         alpha = float(alpha)
         if isinstance(x, (int, float)):
-            self.vector()[:] += alpha * float(x)
+            self._data[:] += alpha * float(x)
         else:
             assert isinstance(x, Function)
-            self.vector()[:] += alpha * x.vector()
+            y = self._data
+            if _daxpy is not None \
+                    and y.dtype == np.float64 and x._data.dtype == np.float64 \
+                    and y.flags.c_contiguous and x._data.flags.c_contiguous:
+                # Updates y in place
+                _daxpy(x._data, y, a=alpha)
+            elif alpha == 1.0:
+                np.add(y, x._data, out=y)
+            elif alpha == -1.0:
+                np.subtract(y, x._data, out=y)
+            else:
+                y += alpha * x._data
 
     def _inner(self, y):
         assert isinstance(y, Function)
-        return self.vector().dot(y.vector())
+        if _ddot is None:
+            return self._data.dot(y._data)
+        else:
+            return _ddot(self._data, y._data)
 
     def _max_value(self):
-        return self.vector().max()
+        return self._data.max()
 
     def _sum(self):
-        return self.vector().sum()
+        return self._data.sum()
 
     def _linf_norm(self):
-        return abs(self.vector()).max()
+        # Real valued, so avoid allocating abs(self._data)
+        return max(self._data.max(), -self._data.min())
 
     def _local_size(self):
-        return self.vector().shape[0]
+        return self._data.shape[0]
 
     def _global_size(self):
-        return self.vector().shape[0]
+        return self._data.shape[0]
 
     def _local_indices(self):
-        return slice(0, self.vector().shape[0])
+        return slice(0, self._data.shape[0])
 
     def _get_values(self):
-        values = self.vector().view()
+        # dtype checked in Function.__init__
+        values = self._data.view()
         values.setflags(write=False)
-        if not np.can_cast(values, np.float64):
-            raise InterfaceException("Invalid dtype")
         return values
 
     def _set_values(self, values):
         if not np.can_cast(values, np.float64):
             raise InterfaceException("Invalid dtype")
-        if values.shape != self.vector().shape:
+        if values.shape != self._data.shape:
             raise InterfaceException("Invalid shape")
-        self.vector()[:] = values
+        self._data[:] = values
 
     def _new(self, name=None, static=False, cache=None, checkpoint=None):
         return Function(self.space(), name=name, static=static,
@@ -169,7 +189,7 @@ class FunctionInterface(_FunctionInterface):
 
     def _copy(self, name=None, static=False, cache=None, checkpoint=None):
         return Function(self.space(), name=name, static=static, cache=cache,
-                        checkpoint=checkpoint, _data=self.vector().copy())
+                        checkpoint=checkpoint, _data=self._data.copy())
 
     def _tangent_linear(self, name=None):
         return self.tangent_linear(name=name)
@@ -181,27 +201,23 @@ class FunctionInterface(_FunctionInterface):
         return False
 
     def _is_real(self):
-        return self.space().dim() == 1
+        return self._space._dim == 1
 
     def _real_value(self):
         # assert is_real_function(self)
-        return self.vector()[0]
+        return self._data[0]
 
 
 class Function:
     def __init__(self, space, name=None, static=False, cache=None,
                  checkpoint=None, _data=None):
-        id = new_function_id()
-        if name is None:
-            # Following FEniCS 2019.1.0 behaviour
-            name = f"f_{id:d}"
         if cache is None:
             cache = static
         if checkpoint is None:
             checkpoint = not static
 
         self._space = space
-        self._id = id
+        self._id = new_function_id()
         self._name = name
         self._state = 0
         self._static = static
@@ -209,7 +225,7 @@ class Function:
         self._checkpoint = checkpoint
         self._replacement = None
         if _data is None:
-            self._data = np.zeros(space.dim(), dtype=np.float64)
+            self._data = np.zeros(space._dim, dtype=np.float64)
         else:
             if not np.can_cast(_data, np.float64):
                 raise InterfaceException("Invalid dtype")
@@ -223,6 +239,10 @@ class Function:
         return self._id
 
     def name(self):
+        if self._name is None:
+            # Following FEniCS 2019.1.0 behaviour. Constructed on first use,
+            # as the names of most intermediate functions are never needed.
+            self._name = f"f_{self._id}"
         return self._name
 
     def state(self):
@@ -294,17 +314,18 @@ class ReplacementInterface(_FunctionInterface):
         return True
 
     def _is_real(self):
-        return self.space().dim() == 1
+        return self._space._dim == 1
 
 
 class Replacement:
     def __init__(self, x):
-        self._space = x.space()
-        self._id = x.id()
+        # Constructed via Function.replacement, so x is a Function
+        self._space = x._space
+        self._id = x._id
         self._name = x.name()
-        self._static = x.is_static()
-        self._cache = x.is_cached()
-        self._checkpoint = x.is_checkpointed()
+        self._static = x._static
+        self._cache = x._cache
+        self._checkpoint = x._checkpoint
         add_interface(self, ReplacementInterface)
 
     def space(self):
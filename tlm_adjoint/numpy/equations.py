@@ -18,10 +18,10 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with tlm_adjoint.  If not, see <https://www.gnu.org/licenses/>.
 
-from ..interface import space_new
-
 from ..equations import EquationException, LinearEquation, Matrix, RHS
 
+from .backend_interface import Function
+
 import numpy as np
 
 __all__ = \
@@ -76,8 +76,8 @@ class ConstantMatrix(Matrix):
         raise EquationException("Unexpected call to adjoint_derivative_action")
 
     def adjoint_solve(self, adj_x, nl_deps, b):
-        return space_new(b.space(),
-                         _data=np.linalg.solve(self.A_T(), b.vector()))
+        return Function(b.space(),
+                        _data=np.linalg.solve(self.A_T(), b.vector()))
 
     def tangent_linear_rhs(self, M, dM, tlm_map, x):
         return None
@@ -406,117 +406,129 @@ class ReplayStorage:
 
 class DependencyGraphTranspose:
     def __init__(self, blocks, M, Js, prune_forward=True, prune_adjoint=True):
+        # Function ids, computed once for each equation
+        X_ids = tuple(tuple(tuple(function_id(x) for x in eq.X())
+                            for eq in block)
+                      for block in blocks)
+        dep_ids = tuple(tuple(tuple(function_id(dep)
+                                    for dep in eq.dependencies())
+                              for eq in block)
+                        for block in blocks)
+        adj_ic_ids = tuple(tuple(
+            frozenset(function_id(dep)
+                      for dep in eq.adjoint_initial_condition_dependencies())
+            for eq in block) for block in blocks)
+
         # Transpose dependency graph
         last_eq = {}
-        transpose_deps = tuple(tuple([None for dep in eq.dependencies()]
-                                     for eq in block)
-                               for block in blocks)
+        transpose_deps = tuple(tuple([None for dep_id in dep_ids_ni]
+                                     for dep_ids_ni in dep_ids_n)
+                               for dep_ids_n in dep_ids)
         for n, block in enumerate(blocks):
-            for i, eq in enumerate(block):
-                for m, x in enumerate(eq.X()):
-                    last_eq[function_id(x)] = (n, i, m)
-                for j, dep in enumerate(eq.dependencies()):
-                    dep_id = function_id(dep)
-                    if dep_id in last_eq:
-                        p, k, m = last_eq[dep_id]
+            for i in range(len(block)):
+                for m, x_id in enumerate(X_ids[n][i]):
+                    last_eq[x_id] = (n, i, m)
+                transpose_deps_ni = transpose_deps[n][i]
+                for j, dep_id in enumerate(dep_ids[n][i]):
+                    last_eq_dep = last_eq.get(dep_id, None)
+                    if last_eq_dep is not None:
+                        p, k, m = last_eq_dep
                         if p < n or k < i:
-                            transpose_deps[n][i][j] = (p, k, m)
+                            transpose_deps_ni[j] = last_eq_dep
         del last_eq
 
         if prune_forward:
             # Extra reverse traversal to add edges associated with adjoint
             # initial conditions
             last_eq = {}
-            transpose_deps_ics = copy.deepcopy(transpose_deps)
+            transpose_deps_ics = tuple(
+                tuple(list(transpose_deps_ni)
+                      for transpose_deps_ni in transpose_deps_n)
+                for transpose_deps_n in transpose_deps)
             for p in range(len(blocks) - 1, -1, -1):
-                block = blocks[p]
-                for k in range(len(block) - 1, -1, -1):
-                    eq = block[k]
-                    X_map = {function_id(x): m for m, x in enumerate(eq.X())}
-                    dep_map = {function_id(dep): j
-                               for j, dep in enumerate(eq.dependencies())}
-                    for dep in eq.adjoint_initial_condition_dependencies():
-                        dep_id = function_id(dep)
-                        if dep_id in last_eq:
-                            n, i, m = last_eq[dep_id]
+                for k in range(len(blocks[p]) - 1, -1, -1):
+                    X_map = {x_id: m for m, x_id in enumerate(X_ids[p][k])}
+                    dep_map = {dep_id: j
+                               for j, dep_id in enumerate(dep_ids[p][k])}
+                    for dep_id in adj_ic_ids[p][k]:
+                        last_eq_dep = last_eq.get(dep_id, None)
+                        if last_eq_dep is not None:
+                            n, i, m = last_eq_dep
                             assert n > p or (n == p and i > k)
                             transpose_deps_ics[n][i][m] \
                                 = (p, k, dep_map[dep_id])
-                    for m, x in enumerate(eq.X()):
-                        x_id = function_id(x)
+                    for x_id in X_ids[p][k]:
                         last_eq[x_id] = (p, k, X_map[x_id])
             del last_eq
 
             # Pruning, forward traversal
             active_M = {function_id(dep) for dep in M}
-            active_forward = tuple(np.full(len(block), False, dtype=bool)
-                                   for block in blocks)
+            active_forward = tuple(bytearray(len(block)) for block in blocks)
             for n, block in enumerate(blocks):
-                for i, eq in enumerate(block):
+                for i in range(len(block)):
                     if len(active_M) > 0:
-                        X_ids = {function_id(x) for x in eq.X()}
-                        for x_id in X_ids:
+                        for x_id in X_ids[n][i]:
                             if x_id in active_M:
-                                active_M.difference_update(X_ids)
+                                active_M.difference_update(X_ids[n][i])
                                 active_forward[n][i] = True
                                 break
                     if not active_forward[n][i]:
-                        for j, dep in enumerate(eq.dependencies()):
-                            if transpose_deps_ics[n][i][j] is not None:
-                                p, k, m = transpose_deps_ics[n][i][j]
+                        for transpose_dep in transpose_deps_ics[n][i]:
+                            if transpose_dep is not None:
+                                p, k, m = transpose_dep
                                 if active_forward[p][k]:
                                     active_forward[n][i] = True
                                     break
         else:
-            active_forward = tuple(np.full(len(block), True, dtype=bool)
+            active_forward = tuple(bytearray(b"\x01" * len(block))
                                    for block in blocks)
 
-        active = {function_id(J): copy.deepcopy(active_forward) for J in Js}
+        active = {function_id(J): tuple(active_forward_n.copy()
+                                        for active_forward_n in active_forward)
+                  for J in Js}
 
         if prune_adjoint:
             # Pruning, reverse traversal
             for J_id in active:
                 active_J = True
-                active_adjoint = tuple(np.full(len(block), False, dtype=bool)
+                active_adjoint = tuple(bytearray(len(block))
                                        for block in blocks)
                 for n in range(len(blocks) - 1, -1, -1):
-                    block = blocks[n]
-                    for i in range(len(block) - 1, -1, -1):
-                        eq = block[i]
+                    for i in range(len(blocks[n]) - 1, -1, -1):
                         if active_J:
-                            for x in eq.X():
-                                if function_id(x) == J_id:
+                            for x_id in X_ids[n][i]:
+                                if x_id == J_id:
                                     active_J = False
                                     active_adjoint[n][i] = True
                                     break
                         if active_adjoint[n][i]:
-                            for j, dep in enumerate(eq.dependencies()):
-                                if transpose_deps[n][i][j] is not None:
-                                    p, k, m = transpose_deps[n][i][j]
+                            for transpose_dep in transpose_deps[n][i]:
+                                if transpose_dep is not None:
+                                    p, k, m = transpose_dep
                                     active_adjoint[p][k] = True
                         else:
                             active[J_id][n][i] = False
 
-        stored_adj_ics = {function_id(J): tuple(tuple(np.full(len(eq.X()), False, dtype=bool)  # noqa: E501
-                          for eq in block) for block in blocks) for J in Js}
+        stored_adj_ics = {function_id(J): tuple(tuple(bytearray(len(X_ids_ni))
+                                                      for X_ids_ni in X_ids_n)
+                                                for X_ids_n in X_ids)
+                          for J in Js}
         adj_ics = {function_id(J): {} for J in Js}
         for J_id in stored_adj_ics:
             stored = {}
             for n, block in enumerate(blocks):
-                for i, eq in enumerate(block):
+                for i in range(len(block)):
                     if active[J_id][n][i]:
-                        for m, x in enumerate(eq.X()):
+                        for m, x_id in enumerate(X_ids[n][i]):
                             stored_adj_ics[J_id][n][i][m] = \
-                                stored.get(function_id(x), False)
+                                stored.get(x_id, False)
 
-                        adj_ic_ids = {function_id(dep) for dep in eq.adjoint_initial_condition_dependencies()}  # noqa: E501
-                        for dep_id in adj_ic_ids:
+                        for dep_id in adj_ic_ids[n][i]:
                             stored[dep_id] = True
                             if dep_id not in adj_ics[J_id]:
                                 adj_ics[J_id][dep_id] = True
-                        for x in eq.X():
-                            x_id = function_id(x)
-                            if x_id not in adj_ic_ids:
+                        for x_id in X_ids[n][i]:
+                            if x_id not in adj_ic_ids[n][i]:
                                 stored[x_id] = False
                                 if x_id not in adj_ics[J_id]:
                                     adj_ics[J_id][x_id] = False
@@ -535,6 +547,21 @@ class DependencyGraphTranspose:
         p, k, m = self._transpose_deps[n][i][j]
         return p, k, m
 
+    def adj_Bs(self, J, n, i, B):
+        if isinstance(J, int):
+            J_id = J
+        else:
+            J_id = function_id(J)
+        active = self._active[J_id]
+
+        dep_Bs = {}
+        for j, transpose_dep in enumerate(self._transpose_deps[n][i]):
+            if transpose_dep is not None:
+                p, k, m = transpose_dep
+                if active[p][k]:
+                    dep_Bs[j] = B[p][k][m]
+        return dep_Bs
+
     def is_active(self, J, n, i):
         if isinstance(J, int):
             J_id = J
@@ -1615,12 +1642,8 @@ class EquationManager:
 
                         eq_B = eq_B.B()
 
-                        eq_dep_Bs = {}
-                        for j, dep in enumerate(eq.dependencies()):
-                            if (n, i, j) in transpose_deps:
-                                p, k, m = transpose_deps[(n, i, j)]
-                                if transpose_deps.is_active(J_marker, p, k):
-                                    eq_dep_Bs[j] = Bs[J_i][p][k][m]
+                        eq_dep_Bs = transpose_deps.adj_Bs(J_marker, n, i,
+                                                          Bs[J_i])
 
                         adj_X = eq.adjoint(J, adj_X, nl_deps, eq_B, eq_dep_Bs)
 